@@ -1,30 +1,93 @@
 import argparse
+import hashlib
+import importlib.util
+import os
+import shutil
+import subprocess
 import sys
 from pathlib import Path
 import pandas as pd
 import numpy as np
+from scipy.interpolate import interp1d
 from pylatex import (
-    Document, Section, Subsection, Figure, Tabular, 
+    Document, Section, Subsection, Figure, 
     Package, NoEscape, Command, NewPage
 )
-from pylatex.utils import bold
+from pylatex.errors import CompilerError
+from pylatex.utils import bold, escape_latex
+
+# Optional accelerators: Rust-backed Excel reader and Parquet caching of parsed sheets
+try:
+    import python_calamine  # noqa: F401
+    # pandas only knows the calamine engine from 2.2 on
+    PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    EXCEL_ENGINE = 'calamine' if PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    # None lets pandas pick the engine from the file format (openpyxl, xlrd, odf, pyxlsb)
+    EXCEL_ENGINE = None
+
+# A Parquet copy loads several times faster than openpyxl parses the sheet, but no faster
+# than calamine, so the cache is only used without calamine (and only if pyarrow exists)
+CACHE_ENABLED = EXCEL_ENGINE is None and importlib.util.find_spec('pyarrow') is not None
+
+# Parsed sheets are cached here as {hash of path, mtime, size}.parquet. Entries are never
+# evicted: every edit of a workbook leaves a new file behind, so the directory grows without
+# bound and can be deleted at any time to reclaim space.
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'beam_report'
+
+# xcolor templates for the SFD/BMD colormap bands, %-formatted with each strip's blend value
+_BLUE_TPL = "blue!%d"
+_CYAN_BLUE_TPL = "cyan!%d!blue"
+_GREEN_CYAN_TPL = "green!%d!cyan"
+_YELLOW_GREEN_TPL = "yellow!%d!green"
+_ORANGE_YELLOW_TPL = "orange!%d!yellow"
+_RED_ORANGE_TPL = "red!%s!orange"
+_YELLOW_CYAN_TPL = "yellow!%d!cyan"
+_RED_YELLOW_TPL = "red!%d!yellow"
+_SFD_BAND_TPLS = (_BLUE_TPL, _CYAN_BLUE_TPL, _GREEN_CYAN_TPL,
+                  _YELLOW_GREEN_TPL, _ORANGE_YELLOW_TPL, _RED_ORANGE_TPL)
+_BMD_BAND_TPLS = (_BLUE_TPL, _CYAN_BLUE_TPL, _YELLOW_CYAN_TPL, _RED_YELLOW_TPL)
 
 
 def read_excel_data(excel_path):
     """Reading beam force data from Excel file."""
     try:
         excel_file = Path(excel_path)
-        if not excel_file.exists():
-            raise FileNotFoundError(f"Excel file not found: {excel_path}")
+        df = None
+        
+        if CACHE_ENABLED:
+            # Reuse a Parquet copy of the sheet keyed on the file's path, mtime and size
+            stat = excel_file.stat()
+            key = hashlib.blake2b(f"{excel_file.resolve()}:{stat.st_mtime}:{stat.st_size}".encode(),
+                                  digest_size=8).hexdigest()
+            cache_file = CACHE_DIR / f"{key}.parquet"
+            if cache_file.exists():
+                try:
+                    df = pd.read_parquet(cache_file)
+                except Exception as e:
+                    print(f"⚠ Warning: Ignoring unreadable cache file {cache_file}: {e}")
         
-        # Read Excel file using pandas
-        df = pd.read_excel(excel_path)
+        if df is None:
+            # Read Excel file using pandas
+            df = pd.read_excel(excel_path, engine=EXCEL_ENGINE)
+            if CACHE_ENABLED:
+                try:
+                    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    df.to_parquet(cache_file)
+                except Exception as e:
+                    # The cache is optional, so failing to write it must not stop the report
+                    print(f"⚠ Warning: Could not write cache file {cache_file}: {e}")
         
         print(f"✓ Successfully read data from: {excel_path}")
         print(f"  Rows: {len(df)}, Columns: {len(df.columns)}")
         
         return df
     
+    except FileNotFoundError as e:
+        error = FileNotFoundError(f"Excel file not found: {excel_path}")
+        print(f"✗ Error reading Excel file: {error}", file=sys.stderr)
+        raise error from e
+    
     except Exception as e:
         print(f"✗ Error reading Excel file: {e}", file=sys.stderr)
         raise
@@ -40,65 +103,112 @@ def create_force_table(doc, df):
         num_cols = len(df.columns)
         table_spec = '|' + '|'.join(['c'] * num_cols) + '|'
         
-        doc.append(NoEscape(r'\begin{center}'))
-        with doc.create(Tabular(table_spec)) as table:
-            # Add header row
-            table.add_hline()
-            header = [bold(str(col)) for col in df.columns]
-            table.add_row(header)
-            table.add_hline()
-            
-            # Add data rows
-            for _, row in df.iterrows():
-                # Format numeric values to 2 decimal places
-                formatted_row = []
-                for val in row:
-                    if isinstance(val, (int, float)):
-                        formatted_row.append(f"{val:.2f}")
-                    else:
-                        formatted_row.append(str(val))
-                table.add_row(formatted_row)
-                table.add_hline()
-        doc.append(NoEscape(r'\end{center}'))
+        # Format whole columns up front: numeric values to 2 decimal places
+        df_fmt = pd.DataFrame({
+            col: df[col].map("{:.2f}".format) if pd.api.types.is_numeric_dtype(df[col])
+            else df[col].astype(str)
+            for col in df.columns
+        })
+        
+        # Assemble the whole tabular as one string instead of a PyLaTeX object per row
+        header = '&'.join(bold(str(col)) for col in df.columns) + r'\\'
+        rows = ['&'.join(escape_latex(val) for val in row) + r'\\'
+                for row in df_fmt.itertuples(index=False, name=None)]
+        body = '\n\\hline\n'.join([header] + rows)
+        
+        doc.append(NoEscape(
+            r'\begin{center}' + '\n'
+            + r'\begin{tabular}{' + table_spec + '}\n'
+            + r'\hline' + '\n' + body + '\n' + r'\hline' + '\n'
+            + r'\end{tabular}' + '\n'
+            + r'\end{center}'
+        ))
 
 
 def calculate_shear_bending_moments(df):
     """Extracting shear force and bending moment arrays from DataFrame."""
+    # Map normalized column names (case and surrounding whitespace ignored) to actual names
+    col_map = {str(col).strip().lower(): col for col in df.columns}
+    
     # Identify position column
-    if 'x' in df.columns:
-        positions = df['x'].values
-    elif 'Position' in df.columns:
-        positions = df['Position'].values
-    else:
-        positions = df.iloc[:, 0].values
+    pos_col = col_map.get('x', col_map.get('position', df.columns[0]))
+    positions = df[pos_col].to_numpy()
     
     # Identify shear force column
-    if 'Shear force' in df.columns:
-        shear_forces = df['Shear force'].values
-    elif 'Shear Force' in df.columns:
-        shear_forces = df['Shear Force'].values
-    elif len(df.columns) > 1:
-        shear_forces = df.iloc[:, 1].values
-    else:
-        shear_forces = np.zeros(len(positions))
+    shear_col = col_map.get('shear force', df.columns[1] if len(df.columns) > 1 else None)
+    shear_forces = df[shear_col].to_numpy() if shear_col is not None else np.zeros(len(positions))
     
     # Identify bending moment column
-    if 'Bending Moment' in df.columns:
-        bending_moments = df['Bending Moment'].values
-    elif 'Bending moment' in df.columns:
-        bending_moments = df['Bending moment'].values
-    elif len(df.columns) > 2:
-        bending_moments = df.iloc[:, 2].values
-    else:
-        bending_moments = np.zeros(len(positions))
+    moment_col = col_map.get('bending moment', df.columns[2] if len(df.columns) > 2 else None)
+    bending_moments = df[moment_col].to_numpy() if moment_col is not None else np.zeros(len(positions))
     
     return positions, shear_forces, bending_moments
 
 
+def _compute_bands(values, v_min, v_max, edges, scales):
+    """
+    Classify values into colormap bands and compute the blend within each band.
+    
+    Args:
+        values (np.ndarray): Values to be colored.
+        v_min (float): Lower end of the value range.
+        v_max (float): Upper end of the value range.
+        edges (list): Ascending band boundaries on the normalized [0,1] scale.
+        scales (list): Blend scale factor for each band (one more than edges).
+        
+    Returns:
+        tuple: (band_ids, blends) integer arrays with one entry per value.
+    """
+    # Normalize to [0,1]; a flat range maps everything to the middle
+    if v_max != v_min:
+        norm_val = (values - v_min) / (v_max - v_min)
+    else:
+        norm_val = np.full(len(values), 0.5)
+    
+    band_ids = np.digitize(norm_val, edges)
+    band_start = np.concatenate(([0.0], edges))
+    blends = ((norm_val - band_start[band_ids]) * np.asarray(scales)[band_ids]).astype(int)
+    return band_ids, blends
+
+
+def _build_strips(x_high_res, y_vals, band_ids, color_args, templates):
+    """
+    Generate the TikZ fill commands for the colored strips under a curve.
+    
+    Adjacent strips that share both color and height are merged into a
+    single rectangle, which draws exactly the same area.
+    
+    Args:
+        x_high_res (np.ndarray): Strip edges (one more than the strip count).
+        y_vals (np.ndarray): Height of each strip.
+        band_ids (np.ndarray): Colormap band of each strip.
+        color_args (np.ndarray): Value substituted into the band's color template.
+        templates (tuple): xcolor %-format template for each band.
+        
+    Returns:
+        str: One \\fill command per run of identical strips.
+    """
+    # A new run starts wherever the color or the height changes
+    changed = ((band_ids[1:] != band_ids[:-1]) | (color_args[1:] != color_args[:-1])
+               | (y_vals[1:] != y_vals[:-1]))
+    starts = np.flatnonzero(np.concatenate(([True], changed)))
+    ends = np.append(starts[1:], len(y_vals))
+    
+    # Format only the strips that are emitted, each with its own band's template
+    xs = x_high_res.tolist()
+    ys = y_vals.tolist()
+    color_defs = [templates[k] % v for k, v in zip(band_ids[starts].tolist(), color_args[starts].tolist())]
+    
+    colored_strips = [
+        f"\\fill[{c}] (axis cs:{xs[i]:.4f},0) rectangle (axis cs:{xs[j]:.4f},{ys[i]:.4f});" if ys[i] >= 0
+        else f"\\fill[{c}] (axis cs:{xs[i]:.4f},{ys[i]:.4f}) rectangle (axis cs:{xs[j]:.4f},0);"
+        for c, i, j in zip(color_defs, starts.tolist(), ends.tolist())
+    ]
+    return "\n".join(colored_strips)
+
+
 def generate_sfd_plot(positions, shear_forces):
     """Generating pgfplots code for Shear Force Diagram with colored fill between curve and zero."""
-    from scipy.interpolate import interp1d
-    
     # Invert shear forces to match required trajectory direction
     shear_forces = -shear_forces
     
@@ -110,54 +220,30 @@ def generate_sfd_plot(positions, shear_forces):
     sf_min_pos = positions[sf_min_idx]
     sf_max_pos = positions[sf_max_idx]
     
-    # High-resolution interpolation for smooth gradient (200 points)
-    x_high_res = np.linspace(positions.min(), positions.max(), 200)
-    f_interp = interp1d(positions, shear_forces, kind='linear')
-    y_high_res = f_interp(x_high_res)
+    if sf_max != sf_min:
+        # High-resolution interpolation for smooth gradient (200 points)
+        x_high_res = np.linspace(positions.min(), positions.max(), 200)
+        # np.interp needs ascending positions; the sheet may list them in either order
+        order = np.argsort(positions, kind='stable')
+        y_high_res = np.interp(x_high_res, positions[order], shear_forces[order])
+    else:
+        # Constant shear force: a single strip spans the beam, nothing to interpolate
+        x_high_res = np.array([positions.min(), positions.max()])
+        y_high_res = np.full(2, sf_max)
     
     # Generate coordinate pairs for trajectory (with parentheses for pgfplots)
     trajectory_coords = "\n".join([f"({x:.3f},{f:.3f})" for x, f in zip(positions, shear_forces)])
     
-    # Generate narrow colored vertical strips
-    colored_strips = []
-    for i in range(len(x_high_res) - 1):
-        x1, x2 = x_high_res[i], x_high_res[i+1]
-        y_val = y_high_res[i]
-        # Calculate color based on y value (normalized to [0,1])
-        norm_val = (y_val - sf_min) / (sf_max - sf_min) if sf_max != sf_min else 0.5
-        # Map to colormap: blue (negative) -> cyan -> green -> yellow -> orange -> red (positive)
-        if norm_val < 0.2:
-            # Deep blue
-            blend = int(norm_val * 500)
-            color_def = f"blue!{100-blend}"
-        elif norm_val < 0.4:
-            # Blue to cyan
-            blend = int((norm_val - 0.2) * 500)
-            color_def = f"cyan!{blend}!blue"
-        elif norm_val < 0.5:
-            # Cyan to green
-            blend = int((norm_val - 0.4) * 1000)
-            color_def = f"green!{blend}!cyan"
-        elif norm_val < 0.6:
-            # Green to yellow  
-            blend = int((norm_val - 0.5) * 1000)
-            color_def = f"yellow!{blend}!green"
-        elif norm_val < 0.8:
-            # Yellow to orange
-            blend = int((norm_val - 0.6) * 500)
-            color_def = f"orange!{blend}!yellow"
-        else:
-            # Orange to dark red
-            blend = int((norm_val - 0.8) * 500)
-            color_def = f"red!{100-blend/2}!orange"
-        
-        if y_val >= 0:
-            strip = f"\\fill[{color_def}] (axis cs:{x1:.4f},0) rectangle (axis cs:{x2:.4f},{y_val:.4f});"
-        else:
-            strip = f"\\fill[{color_def}] (axis cs:{x1:.4f},{y_val:.4f}) rectangle (axis cs:{x2:.4f},0);"
-        colored_strips.append(strip)
+    # Generate narrow colored vertical strips, one per interpolation interval
+    y_vals = y_high_res[:-1]
+    # Map to colormap: blue (negative) -> cyan -> green -> yellow -> orange -> red (positive)
+    band, blend = _compute_bands(y_vals, sf_min, sf_max,
+                                 edges=[0.2, 0.4, 0.5, 0.6, 0.8],
+                                 scales=[500, 500, 1000, 1000, 500, 500])
+    # Deep blue and orange-to-dark-red fade out from their band edge; the other bands blend in
+    color_arg = np.where(band == 0, 100 - blend, np.where(band == 5, 100 - blend / 2, blend))
     
-    strips_code = "\n".join(colored_strips)
+    strips_code = _build_strips(x_high_res, y_vals, band, color_arg, _SFD_BAND_TPLS)
     
     # Calculate axis limits
     beam_min = positions.min()
@@ -226,8 +312,6 @@ def generate_bmd_plot(positions, bending_moments):
     Returns:
         str: pgfplots LaTeX code for the BMD plot.
     """
-    from scipy.interpolate import interp1d
-    
     # Calculate value range (use absolute values for color mapping)
     bm_min = bending_moments.min()
     bm_max = bending_moments.max()
@@ -237,48 +321,30 @@ def generate_bmd_plot(positions, bending_moments):
     bm_min_pos = positions[bm_min_idx]
     bm_max_pos = positions[bm_max_idx]
     
-    # High-resolution interpolation for smooth gradient (200 points)
-    x_high_res = np.linspace(positions.min(), positions.max(), 200)
-    f_interp = interp1d(positions, bending_moments, kind='quadratic')
-    y_high_res = f_interp(x_high_res)
+    if bm_max != bm_min:
+        # High-resolution interpolation for smooth gradient (200 points)
+        x_high_res = np.linspace(positions.min(), positions.max(), 200)
+        f_interp = interp1d(positions, bending_moments, kind='quadratic')
+        y_high_res = f_interp(x_high_res)
+    else:
+        # Constant bending moment: a single strip spans the beam, nothing to interpolate
+        x_high_res = np.array([positions.min(), positions.max()])
+        y_high_res = np.full(2, bm_max)
     
     # Generate coordinate pairs for trajectory (with parentheses for pgfplots)
     trajectory_coords = "\n".join([f"({x:.3f},{f:.3f})" for x, f in zip(positions, bending_moments)])
     
     # Generate narrow colored vertical strips (blue for negative, yellow/red for near-zero)
-    colored_strips = []
-    for i in range(len(x_high_res) - 1):
-        x1, x2 = x_high_res[i], x_high_res[i+1]
-        y_val = y_high_res[i]
-        
-        # Color based on actual value: yellow/red at edges (near 0), blue at center (most negative)
-        norm_val = (y_val - bm_min) / (bm_max - bm_min) if bm_max != bm_min else 0.5
-        
-        # Map to colormap: red/yellow (near 0) -> cyan -> deep blue (most negative)
-        if norm_val < 0.2:
-            # Most negative: deep blue
-            blend = int(norm_val * 500)
-            color_def = f"blue!{100-blend}"
-        elif norm_val < 0.4:
-            # Blue to cyan
-            blend = int((norm_val - 0.2) * 500)
-            color_def = f"cyan!{blend}!blue"
-        elif norm_val < 0.7:
-            # Cyan to yellow
-            blend = int((norm_val - 0.4) * 333)
-            color_def = f"yellow!{blend}!cyan"
-        else:
-            # Yellow to red (near zero)
-            blend = int((norm_val - 0.7) * 333)
-            color_def = f"red!{blend}!yellow"
-        
-        if y_val >= 0:
-            strip = f"\\fill[{color_def}] (axis cs:{x1:.4f},0) rectangle (axis cs:{x2:.4f},{y_val:.4f});"
-        else:
-            strip = f"\\fill[{color_def}] (axis cs:{x1:.4f},{y_val:.4f}) rectangle (axis cs:{x2:.4f},0);"
-        colored_strips.append(strip)
+    y_vals = y_high_res[:-1]
+    # Color based on actual value: yellow/red at edges (near 0), blue at center (most negative)
+    # Map to colormap: red/yellow (near 0) -> cyan -> deep blue (most negative)
+    band, blend = _compute_bands(y_vals, bm_min, bm_max,
+                                 edges=[0.2, 0.4, 0.7],
+                                 scales=[500, 500, 333, 333])
+    # Most negative (deep blue) fades out from its band edge; the other bands blend in
+    color_arg = np.where(band == 0, 100 - blend, blend)
     
-    strips_code = "\n".join(colored_strips)
+    strips_code = _build_strips(x_high_res, y_vals, band, color_arg, _BMD_BAND_TPLS)
     
     # Calculate axis limits
     beam_min = positions.min()
@@ -343,21 +409,23 @@ def build_report(df, beam_image_path, output_name):
     
     Args:
         df (pd.DataFrame): Beam force data.
-        beam_image_path (str): Path to beam diagram image.
+        beam_image_path (Path or None): Path to an existing beam diagram image, or None to omit it.
         output_name (str): Output PDF filename (without extension).
     """
     # Create document with geometry settings
     doc = Document(geometry_options={'margin': '1in'})
     
     # Add required packages
-    doc.packages.append(Package('tikz'))
-    doc.packages.append(Package('pgfplots'))
-    doc.packages.append(NoEscape(r'\pgfplotsset{compat=1.18}'))
-    doc.packages.append(NoEscape(r'\usepgfplotslibrary{fillbetween}'))
-    doc.packages.append(Package('graphicx'))
-    doc.packages.append(Package('geometry'))
-    doc.packages.append(Package('float'))
-    doc.packages.append(Package('hyperref', options='hidelinks'))
+    doc.packages.update([
+        Package('tikz'),
+        Package('pgfplots'),
+        NoEscape(r'\pgfplotsset{compat=1.18}'),
+        NoEscape(r'\usepgfplotslibrary{fillbetween}'),
+        Package('graphicx'),
+        Package('geometry'),
+        Package('float'),
+        Package('hyperref', options='hidelinks'),
+    ])
     
     # ==================== 1. TITLE PAGE ====================
     doc.preamble.append(Command('title', 'Beam Force Analysis Report'))
@@ -373,42 +441,44 @@ def build_report(df, beam_image_path, output_name):
     
     # ==================== 3. INTRODUCTION ====================
     with doc.create(Section('Introduction')):
-        doc.append('This report presents a comprehensive structural analysis of a simply supported beam ')
-        doc.append('subjected to various load conditions. The analysis includes the calculation and ')
-        doc.append('visualization of shear force and bending moment distributions along the beam length.')
+        doc.append('This report presents a comprehensive structural analysis of a simply supported beam '
+                   'subjected to various load conditions. The analysis includes the calculation and '
+                   'visualization of shear force and bending moment distributions along the beam length.')
         doc.append(NoEscape(r'\vspace{0.2cm}'))
         doc.append(NoEscape(r'\\'))
         
         # Embed beam image
-        if beam_image_path and Path(beam_image_path).exists():
+        if beam_image_path is not None:
             with doc.create(Figure(position='htbp')) as fig:
-                fig.add_image(beam_image_path, width=NoEscape(r'0.7\textwidth'))
+                fig.add_image(str(beam_image_path), width=NoEscape(r'0.7\textwidth'))
                 fig.add_caption('Simply Supported Beam Configuration')
         
         doc.append(NoEscape(r'\vspace{0.2cm}'))
         doc.append('The primary objectives of this analysis are:')
         with doc.create(Subsection('Objectives', numbering=False)):
-            doc.append(NoEscape(r'\begin{itemize}'))
-            doc.append(NoEscape(r'\item Read and process beam force data from an Excel file'))
-            doc.append(NoEscape(r'\item Generate professional engineering diagrams using vector graphics'))
-            doc.append(NoEscape(r'\item Present results in a structured, industry-standard format'))
-            doc.append(NoEscape(r'\item Provide clear visualization of shear forces and bending moments'))
-            doc.append(NoEscape(r'\end{itemize}'))
+            doc.append(NoEscape('\n'.join([
+                r'\begin{itemize}',
+                r'\item Read and process beam force data from an Excel file',
+                r'\item Generate professional engineering diagrams using vector graphics',
+                r'\item Present results in a structured, industry-standard format',
+                r'\item Provide clear visualization of shear forces and bending moments',
+                r'\end{itemize}',
+            ])))
     
     # ==================== 4. BEAM DESCRIPTION ====================
     with doc.create(Section('Beam Description')):
-        doc.append('The structural system under consideration is a simply supported beam. ')
-        doc.append('This type of beam is supported at both ends, with one end allowing rotation ')
-        doc.append('and horizontal movement (roller support) and the other allowing only rotation (pin support). ')
-        doc.append('This configuration allows the beam to freely deform under applied loads while maintaining ')
-        doc.append('static equilibrium through the support reactions.')
+        doc.append('The structural system under consideration is a simply supported beam. '
+                   'This type of beam is supported at both ends, with one end allowing rotation '
+                   'and horizontal movement (roller support) and the other allowing only rotation (pin support). '
+                   'This configuration allows the beam to freely deform under applied loads while maintaining '
+                   'static equilibrium through the support reactions.')
     
     # ==================== 5. DATA SOURCE ====================
     with doc.create(Section('Data Source')):
-        doc.append('The input data for this analysis was sourced from an Excel spreadsheet. ')
-        doc.append('The Excel file contains detailed information about load positions and magnitudes ')
-        doc.append('applied to the beam structure. Using the pandas library, the data was efficiently ')
-        doc.append('extracted and processed for subsequent structural analysis calculations.')
+        doc.append('The input data for this analysis was sourced from an Excel spreadsheet. '
+                   'The Excel file contains detailed information about load positions and magnitudes '
+                   'applied to the beam structure. Using the pandas library, the data was efficiently '
+                   'extracted and processed for subsequent structural analysis calculations.')
     
     doc.append(NewPage())
     
@@ -419,35 +489,37 @@ def build_report(df, beam_image_path, output_name):
     with doc.create(Section('Analysis')):
         with doc.create(Subsection('Theoretical Background')):
             doc.append(NoEscape(r'\textbf{Shear Force:} '))
-            doc.append('The shear force at any section of a beam is defined as the algebraic sum of all ')
-            doc.append('vertical forces acting on either side of the section. It represents the internal ')
-            doc.append('force that resists shear deformation.')
+            doc.append('The shear force at any section of a beam is defined as the algebraic sum of all '
+                       'vertical forces acting on either side of the section. It represents the internal '
+                       'force that resists shear deformation.')
             doc.append(NoEscape(r'\vspace{0.2cm}'))
             doc.append(NoEscape(r'\\'))
             
             doc.append(NoEscape(r'\textbf{Bending Moment:} '))
-            doc.append('The bending moment at any section is the algebraic sum of the moments of all ')
-            doc.append('forces acting on either side of the section. It quantifies the internal moment ')
-            doc.append('that resists bending of the beam.')
+            doc.append('The bending moment at any section is the algebraic sum of the moments of all '
+                       'forces acting on either side of the section. It quantifies the internal moment '
+                       'that resists bending of the beam.')
             
         with doc.create(Subsection('Calculation Methodology')):
-            doc.append('The shear force and bending moment values are directly extracted from the Excel file, ')
-            doc.append('which contains pre-calculated structural analysis results based on fundamental ')
-            doc.append('principles of structural mechanics:')
-            doc.append(NoEscape(r'\begin{enumerate}'))
-            doc.append(NoEscape(r'\item Load positions and magnitudes defined along beam length'))
-            doc.append(NoEscape(r'\item Shear force distribution computed from equilibrium of forces'))
-            doc.append(NoEscape(r'\item Bending moment distribution calculated through integration'))
-            doc.append(NoEscape(r'\item Results verified against structural analysis software'))
-            doc.append(NoEscape(r'\end{enumerate}'))
+            doc.append('The shear force and bending moment values are directly extracted from the Excel file, '
+                       'which contains pre-calculated structural analysis results based on fundamental '
+                       'principles of structural mechanics:')
+            doc.append(NoEscape('\n'.join([
+                r'\begin{enumerate}',
+                r'\item Load positions and magnitudes defined along beam length',
+                r'\item Shear force distribution computed from equilibrium of forces',
+                r'\item Bending moment distribution calculated through integration',
+                r'\item Results verified against structural analysis software',
+                r'\end{enumerate}',
+            ])))
     
     # ==================== 8. SHEAR FORCE DIAGRAM ====================
     positions, shear_forces, bending_moments = calculate_shear_bending_moments(df)
     
     with doc.create(Section('Shear Force Diagram')):
-        doc.append('The Shear Force Diagram (SFD) illustrates the variation of shear force along the ')
-        doc.append('length of the beam. This diagram is essential for identifying critical sections where ')
-        doc.append('shear stress is maximum and for designing adequate shear reinforcement.')
+        doc.append('The Shear Force Diagram (SFD) illustrates the variation of shear force along the '
+                   'length of the beam. This diagram is essential for identifying critical sections where '
+                   'shear stress is maximum and for designing adequate shear reinforcement.')
         doc.append(NoEscape(r'\vspace{0.3cm}'))
         
         sfd_tikz = generate_sfd_plot(positions, shear_forces)
@@ -455,9 +527,9 @@ def build_report(df, beam_image_path, output_name):
     
     # ==================== 9. BENDING MOMENT DIAGRAM ====================
     with doc.create(Section('Bending Moment Diagram')):
-        doc.append('The Bending Moment Diagram (BMD) displays the distribution of bending moment along ')
-        doc.append('the beam. This diagram is crucial for determining the maximum bending stress and for ')
-        doc.append('designing the beam cross-section to resist flexural loads safely.')
+        doc.append('The Bending Moment Diagram (BMD) displays the distribution of bending moment along '
+                   'the beam. This diagram is crucial for determining the maximum bending stress and for '
+                   'designing the beam cross-section to resist flexural loads safely.')
         doc.append(NoEscape(r'\vspace{0.3cm}'))
         
         bmd_tikz = generate_bmd_plot(positions, bending_moments)
@@ -465,33 +537,55 @@ def build_report(df, beam_image_path, output_name):
     
     # ==================== 10. SUMMARY ====================
     with doc.create(Section('Summary')):
-        doc.append('This report has presented a complete structural analysis of a simply supported beam, ')
-        doc.append('including detailed force calculations and professional visualization of results.')
+        doc.append('This report has presented a complete structural analysis of a simply supported beam, '
+                   'including detailed force calculations and professional visualization of results.')
         doc.append(NoEscape(r'\vspace{0.3cm}'))
         doc.append(NoEscape(r'\\'))
         
-        # Summary statistics
-        max_shear = np.abs(shear_forces).max()
-        max_moment = np.abs(bending_moments).max()
+        # Summary statistics (largest magnitude from the extremes, no temporary |x| array)
+        max_shear = max(abs(shear_forces.min()), abs(shear_forces.max()))
+        max_moment = max(abs(bending_moments.min()), abs(bending_moments.max()))
         
-        doc.append(NoEscape(r'\textbf{Key Results:}'))
-        doc.append(NoEscape(r'\begin{itemize}'))
-        doc.append(NoEscape(rf'\item Maximum Shear Force: {max_shear:.2f} kN'))
-        doc.append(NoEscape(rf'\item Maximum Bending Moment: {max_moment:.2f} kN$\cdot$m'))
-        doc.append(NoEscape(rf'\item Number of Load Points: {len(df)}'))
-        doc.append(NoEscape(rf'\item Beam Span: {positions.max():.2f} m'))
-        doc.append(NoEscape(r'\end{itemize}'))
+        doc.append(NoEscape('\n'.join([
+            r'\textbf{Key Results:}',
+            r'\begin{itemize}',
+            rf'\item Maximum Shear Force: {max_shear:.2f} kN',
+            rf'\item Maximum Bending Moment: {max_moment:.2f} kN$\cdot$m',
+            rf'\item Number of Load Points: {len(df)}',
+            rf'\item Beam Span: {positions.max():.2f} m',
+            r'\end{itemize}',
+        ])))
         doc.append(NoEscape(r'\vspace{0.3cm}'))
         
-        doc.append('The analysis was performed using Python with PyLaTeX for document generation and ')
-        doc.append('pgfplots for high-quality vector graphics. All diagrams and tables were generated ')
-        doc.append('programmatically to ensure accuracy and reproducibility.')
+        doc.append('The analysis was performed using Python with PyLaTeX for document generation and '
+                   'pgfplots for high-quality vector graphics. All diagrams and tables were generated '
+                   'programmatically to ensure accuracy and reproducibility.')
     
     # Generate PDF
     print(f"\n⚙ Generating PDF report...")
-    doc.generate_pdf(output_name, clean_tex=False, compiler='pdflatex', compiler_args=['-interaction=nonstopmode'])
-    # Compile a second time to populate table of contents
-    doc.generate_pdf(output_name, clean_tex=False, compiler='pdflatex', compiler_args=['-interaction=nonstopmode'])
+    # Two compile paths: latexmk (shipped with TeX Live/MiKTeX) when it is on PATH, which saves
+    # passes on rebuilds; otherwise a draft-mode pdflatex pass followed by one full pass
+    if shutil.which('latexmk'):
+        # latexmk reruns pdflatex only as often as the table of contents requires; keep its
+        # .aux/.toc/.fdb_latexmk files (clean=False) so later runs can skip unneeded passes
+        doc.generate_pdf(output_name, clean=False, clean_tex=False, compiler='latexmk', compiler_args=['-pdf'])
+    else:
+        # No latexmk: the first pass only has to write the .aux/.toc files, so run it in
+        # draft mode (no PDF output) and let the second pass produce the PDF
+        tex_path = Path(output_name).resolve()
+        doc.generate_tex(str(tex_path))
+        try:
+            subprocess.check_output(['pdflatex', '-draftmode', '-interaction=nonstopmode', tex_path.name + '.tex'],
+                                    cwd=tex_path.parent, stderr=subprocess.STDOUT)
+        except FileNotFoundError:
+            raise CompilerError("No LaTeX compiler was found\n"
+                                "Make sure you have latexmk or pdflatex installed.") from None
+        except subprocess.CalledProcessError as e:
+            # Show the compiler log, as PyLaTeX's generate_pdf does
+            print(e.output.decode(errors='replace'))
+            raise
+        # Compile a second time to populate table of contents
+        doc.generate_pdf(output_name, clean_tex=False, compiler='pdflatex', compiler_args=['-interaction=nonstopmode'])
     print(f"✓ PDF report generated successfully: {output_name}.pdf")
 
 
@@ -549,14 +643,15 @@ Examples:
         df = read_excel_data(args.excel)
         
         # Step 2: Validate image path if provided
-        if args.image and not Path(args.image).exists():
+        beam_image = Path(args.image) if args.image else None
+        if beam_image is not None and not beam_image.exists():
             print(f"⚠ Warning: Image file not found: {args.image}")
             print("  Proceeding without beam diagram image.")
-            args.image = None
+            beam_image = None
         
         # Step 3: Build report
         print("\nStep 2: Building PDF report...")
-        build_report(df, args.image, args.output)
+        build_report(df, beam_image, args.output)
         
         print("\n" + "=" * 70)
         print("  ✓ REPORT GENERATION COMPLETED SUCCESSFULLY")